@@ -1,9 +1,35 @@
 """File compare utilities."""
 
 import difflib
-from os import linesep
+from os import linesep, stat
+from os.path import samefile
 from typing import List
 
+_CHUNK_SIZE = 65536
+
+
+def _files_identical(path1: str, path2: str) -> bool:
+    """Check whether two files have the same bytes. Unlike filecmp.cmp, the
+    result is never cached so files rewritten with the same size and
+    modification time are still compared.
+
+    Args:
+        path1 (str): Path to first file
+        path2 (str): Path to second file
+
+    Returns:
+        bool: True if files are byte for byte identical, False if not
+    """
+    if stat(path1).st_size != stat(path2).st_size:
+        return False
+    with open(path1, "rb") as f1, open(path2, "rb") as f2:
+        while True:
+            chunk1 = f1.read(_CHUNK_SIZE)
+            if chunk1 != f2.read(_CHUNK_SIZE):
+                return False
+            if not chunk1:
+                return True
+
 
 def compare_files(
     path1: str, path2: str, encoding: str = "utf-8"
@@ -14,15 +40,23 @@ def compare_files(
     Args:
         path1 (str): Path to first file
         path2 (str): Path to second file
+        encoding (str): Encoding of files. Defaults to utf-8.
 
     Returns:
         List[str]: Delta between the two files
     """
-    diff = difflib.ndiff(
-        open(path1, encoding=encoding).read().splitlines(),
-        open(path2, encoding=encoding).read().splitlines(),
-    )
-    return [x for x in diff if x[0] in ["-", "+", "?"]]
+    # Two paths to the same file (or hard links to it) cannot differ
+    if samefile(path1, path2):
+        return []
+    # Byte for byte identical files need no decoding or diff
+    if _files_identical(path1, path2):
+        return []
+    with open(path1, encoding=encoding) as f:
+        lines1 = [line.rstrip("\n") for line in f]
+    with open(path2, encoding=encoding) as f:
+        lines2 = [line.rstrip("\n") for line in f]
+    diff = difflib.ndiff(lines1, lines2)
+    return [x for x in diff if x[0] in "-+?"]
 
 
 def assert_files_same(path1: str, path2: str, encoding: str = "utf-8") -> None:
@@ -33,6 +67,7 @@ def assert_files_same(path1: str, path2: str, encoding: str = "utf-8") -> None:
     Args:
         path1 (str): Path to first file
         path2 (str): Path to second file
+        encoding (str): Encoding of files. Defaults to utf-8.
 
     Returns:
         None
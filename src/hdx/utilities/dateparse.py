@@ -1,9 +1,12 @@
 """Date parsing utilities."""
 
+import re
 import time
-from calendar import monthrange
-from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple
+from calendar import isleap
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import dateutil
 from dateutil.parser import ParserError, _timelex, parserinfo
@@ -91,6 +94,33 @@ default_timezone_info = """-12 Y
 -9.5 MART MIT"""
 
 
+def _tz_offset_seconds(offset: str) -> int:
+    """Convert a timezone offset in hours with an optional decimal fraction
+    eg. -9.5 into seconds using integer arithmetic only.
+
+    Args:
+        offset (str): Timezone offset in hours
+
+    Returns:
+        int: Timezone offset in seconds
+    """
+    hours, _, fraction = offset.partition(".")
+    if fraction and hours in ("", "+", "-"):
+        tz_offset = 0
+    else:
+        tz_offset = int(hours) * 3600
+    if fraction:
+        if fraction[0] in "+-":
+            raise ValueError(f"Invalid timezone offset: {offset}")
+        digits = len(fraction) - fraction.count("_")
+        fraction_offset = int(fraction) * 3600 // 10**digits
+        if hours.startswith("-"):
+            tz_offset -= fraction_offset
+        else:
+            tz_offset += fraction_offset
+    return tz_offset
+
+
 def get_tzinfos(timezone_info: str) -> Dict[str, int]:
     """Get tzinfos dictionary used by dateutil from timezone information
     string.
@@ -103,20 +133,391 @@ def get_tzinfos(timezone_info: str) -> Dict[str, int]:
     """
     tzinfos = {}
     for tz_descr in map(str.split, timezone_info.split("\n")):
-        tz_offset = int(float(tz_descr[0]) * 3600)
+        try:
+            tz_offset = _tz_offset_seconds(tz_descr[0])
+        except ValueError:
+            # Other forms that float accepts eg. exponents like 55e-1
+            tz_offset = int(float(tz_descr[0]) * 3600)
         for tz_code in tz_descr[1:]:
             tzinfos[tz_code] = tz_offset
     return tzinfos
 
 
-default_tzinfos = get_tzinfos(default_timezone_info)
+# Read only as parse results are cached
+default_tzinfos = MappingProxyType(get_tzinfos(default_timezone_info))
+
+
+@lru_cache(maxsize=16)
+def _get_tzinfos_cached(timezone_info: str) -> Mapping[str, int]:
+    """Memoized version of get_tzinfos for use while parsing. The returned
+    mapping is shared so it is read only.
+
+    Args:
+        timezone_info (str): Timezones information string
+
+    Returns:
+        Mapping[str, int]: Read only tzinfos mapping
+    """
+    return MappingProxyType(get_tzinfos(timezone_info))
+
+
+# ISO 8601 date with optional time and timezone eg. 2013-02-10 or
+# 2013-02-10T10:00:00.5 or 2013-02-10T10:00:00Z or 2013-02-10T10:00:00+05:30
+_iso_datetime = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?"
+    r"(Z|[+-]\d{2}(?::?\d{2})?)?)?",
+    re.ASCII,
+)
+
+
+def _parse_iso_datetime(string: str, ignoretz: bool) -> Optional[datetime]:
+    """Parse an ISO 8601 date with optional time directly rather than through
+    dateutil. For these strings, dateutil would give the same result as every
+    element of the date is present. Strings with a timezone are only handled
+    if the timezone is to be ignored.
+
+    Args:
+        string (str): Date string
+        ignoretz (bool): Whether to ignore timezone information
+
+    Returns:
+        Optional[datetime]: Parsed datetime or None if not in the expected format
+    """
+    match = _iso_datetime.fullmatch(string)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, tz = match.groups()
+    if tz and not ignoretz:
+        return None
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+        )
+    except ValueError:
+        # Leave invalid values like month 13 for dateutil to handle
+        return None
+
+
+# Other common all numeric dates with optional time. For these, dateutil gives
+# day first or year first (when the year leads) if the values are in range
+_numeric_time = (
+    r"(?: (?P<hour>[0-9]{2}):(?P<minute>[0-9]{2})(?::(?P<second>[0-9]{2}))?)?"
+)
+_numeric_datetimes = (
+    # eg. 20/02/2013 or 20.02.2013 10:00
+    re.compile(
+        r"(?P<day>[0-9]{2})(?P<sep>[/.-])(?P<month>[0-9]{2})(?P=sep)(?P<year>[0-9]{4})"
+        + _numeric_time
+    ),
+    # eg. 2013/02/20 or 2013.02.20 10:00:00
+    re.compile(
+        r"(?P<year>[0-9]{4})(?P<sep>[/.])(?P<month>[0-9]{2})(?P=sep)(?P<day>[0-9]{2})"
+        + _numeric_time
+    ),
+    # eg. 20130220
+    re.compile(r"(?P<year>[0-9]{4})(?P<month>[0-9]{2})(?P<day>[0-9]{2})"),
+)
+
+
+def _parse_numeric_datetime(string: str) -> Optional[datetime]:
+    """Parse common all numeric dates with optional time (eg. 20/02/2013 or
+    20130220) directly rather than through dateutil. Values out of range, for
+    which dateutil may swap day and month, are left for dateutil.
+
+    Args:
+        string (str): Date string
+
+    Returns:
+        Optional[datetime]: Parsed datetime or None if not in an expected format
+    """
+    for pattern in _numeric_datetimes:
+        match = pattern.fullmatch(string)
+        if match is None:
+            continue
+        values = match.groupdict()
+        try:
+            return datetime(
+                int(values["year"]),
+                int(values["month"]),
+                int(values["day"]),
+                int(values.get("hour") or 0),
+                int(values.get("minute") or 0),
+                int(values.get("second") or 0),
+            )
+        except ValueError:
+            return None
+    return None
+
+
+# Any digit: strings without one cannot contain a year
+_has_digit = re.compile(r"\d")
+
+# Year or year and month eg. 2013 or 2013-02
+_year_month = re.compile(r"([1-9][0-9]{3})(?:[-/]([0-9]{2}))?")
+
+
+def _parse_year_month(string: str) -> Optional[Tuple[datetime, datetime]]:
+    """Parse a year or a year and month directly rather than through dateutil
+    into a date range from the start of the year or month to its end.
+
+    Args:
+        string (str): Date string
+
+    Returns:
+        Optional[Tuple[datetime, datetime]]: Start and end date or None if not in the expected format
+    """
+    match = _year_month.fullmatch(string)
+    if match is None:
+        return None
+    year, month = match.groups()
+    year = int(year)
+    try:
+        if month is None:
+            return datetime(year, 1, 1), datetime(year, 12, 31)
+        month = int(month)
+        return datetime(year, month, 1), datetime(
+            year, month, _days_in_month(year, month)
+        )
+    except (ValueError, IndexError):
+        # Leave invalid values like month 13 for dateutil to handle
+        return None
+
+
+def _parse_date_range_fast(
+    string: str, ignoretz: bool
+) -> Optional[Tuple[datetime, datetime]]:
+    """Parse common date formats directly rather than through dateutil: ISO
+    8601 dates, all numeric dates and years or years and months.
+
+    Args:
+        string (str): Date string
+        ignoretz (bool): Whether to ignore timezone information
+
+    Returns:
+        Optional[Tuple[datetime, datetime]]: Start and end date or None if not in an expected format
+    """
+    date = _parse_iso_datetime(string, ignoretz)
+    if date is None:
+        date = _parse_numeric_datetime(string)
+        if date is None:
+            return _parse_year_month(string)
+    return date, date
+
+
+# Numeric strptime directives mapped to their position in the datetime
+# constructor arguments and a strict pattern matching them
+_format_directives = {
+    "Y": (0, "([0-9]{4})"),
+    "m": (1, "([0-9]{2})"),
+    "d": (2, "([0-9]{2})"),
+    "H": (3, "([0-9]{2})"),
+    "M": (4, "([0-9]{2})"),
+    "S": (5, "([0-9]{2})"),
+}
+
+
+@lru_cache(maxsize=64)
+def _compile_date_format(
+    date_format: str,
+) -> Optional[Tuple[re.Pattern, Tuple[int, ...]]]:
+    """Compile a date format made up only of numeric directives (%Y, %m, %d,
+    %H, %M and %S) and literal characters into a strict pattern. For any
+    string the pattern matches, building the datetime directly gives the same
+    result as strptime.
+
+    Args:
+        date_format (str): Date format
+
+    Returns:
+        Optional[Tuple[re.Pattern, Tuple[int, ...]]]: Pattern and positions of its groups in datetime arguments or None if format not supported
+    """
+    parts = []
+    positions = []
+    chars = iter(date_format)
+    for char in chars:
+        if char != "%":
+            parts.append(re.escape(char))
+            continue
+        directive = _format_directives.get(next(chars, ""))
+        if directive is None:
+            return None
+        position, part = directive
+        if position in positions:
+            return None
+        positions.append(position)
+        parts.append(part)
+    return re.compile("".join(parts)), tuple(positions)
+
+
+def _strptime(string: str, date_format: str) -> datetime:
+    """Parse date from string using date format. Formats made up only of
+    numeric directives are handled without strptime which parses the format on
+    every call.
+
+    Args:
+        string (str): Date string
+        date_format (str): Date format
+
+    Returns:
+        datetime: Parsed datetime
+    """
+    compiled = _compile_date_format(date_format)
+    if compiled is not None:
+        pattern, positions = compiled
+        match = pattern.fullmatch(string)
+        if match is not None:
+            # strptime defaults
+            values = [1900, 1, 1, 0, 0, 0]
+            for position, value in zip(positions, match.groups()):
+                values[position] = int(value)
+            try:
+                return datetime(*values)
+            except ValueError:
+                # Leave strptime to raise its error
+                pass
+    return datetime.strptime(string, date_format)
+
+
+# Date format directives that can set a non zero time
+_format_time_directives = (
+    "%H",
+    "%I",
+    "%M",
+    "%S",
+    "%f",
+    "%X",
+    "%c",
+    "%T",
+    "%R",
+)
+
+
+@lru_cache(maxsize=256)
+def _format_flags(date_format: str) -> Tuple[bool, bool, bool, bool]:
+    """Get whether a date format specifies the year, the day, the month and
+    any time elements.
+
+    Args:
+        date_format (str): Date format
+
+    Returns:
+        Tuple[bool, bool, bool, bool]: Whether format has year, day, month and time
+    """
+    has_year = "%Y" in date_format
+    has_day = "%d" in date_format or "%j" in date_format
+    has_month = (
+        "%m" in date_format
+        or "%b" in date_format
+        or "%B" in date_format
+        or "%j" in date_format
+    )
+    has_time = any(
+        directive in date_format for directive in _format_time_directives
+    )
+    return has_year, has_day, has_month, has_time
+
+
+# Tokens as produced by dateutil's _timelex for ASCII strings: runs of letters
+# or digits that may be joined by dots (or a comma after 2 or more digits) and
+# are split up later, runs of letters or digits and any other single character
+_TIMELEX_TAIL = r"(?:\.|(?<=\.)[A-Za-z]+|(?<![A-Za-z])[0-9]+)*"
+_timelex_token = re.compile(
+    rf"[A-Za-z]+\.{_TIMELEX_TAIL}|[0-9]{{2,}},{_TIMELEX_TAIL}"
+    rf"|[0-9]+\.{_TIMELEX_TAIL}|[A-Za-z]+|[0-9]+|.",
+    re.DOTALL,
+)
+_timelex_letters = re.compile("[A-Za-z]+")
+_timelex_split_decimal = re.compile("([.,])")
+_timelex_space = frozenset("\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f ")
+
+# Words accepted by float. Any other ASCII token that float accepts starts with
+# a digit since tokens never have leading whitespace, signs or dots
+_float_words = frozenset(("nan", "inf", "infinity"))
+
+
+def _split_tokens(timestr: str) -> List[str]:
+    """Split a date string into the same tokens as dateutil's _timelex.split
+    but using a regular expression rather than reading character by character.
+    Strings that are not ASCII are passed to _timelex.split.
+
+    Args:
+        timestr (str): Date string
+
+    Returns:
+        List[str]: Tokens
+    """
+    if not isinstance(timestr, str) or not timestr.isascii():
+        return _timelex.split(timestr)
+    if "\x00" in timestr:
+        # _timelex skips null characters
+        timestr = timestr.replace("\x00", "")
+    length = len(timestr)
+    tokens = []
+    for match in _timelex_token.finditer(timestr):
+        token = match.group()
+        if len(token) == 1:
+            tokens.append(" " if token in _timelex_space else token)
+            continue
+        if "." not in token and "," not in token:
+            tokens.append(token)
+            continue
+        if token[0].isalpha():
+            seenletters = True
+        else:
+            # _timelex only sees letters after a number once it reads the
+            # character following the first letter
+            letters = _timelex_letters.findall(token)
+            seenletters = bool(letters) and not (
+                len(letters) == 1
+                and len(letters[0]) == 1
+                and token[-1].isalpha()
+                and match.end() == length
+            )
+        if seenletters or token.count(".") > 1 or token[-1] in ".,":
+            tokens.extend(x for x in _timelex_split_decimal.split(token) if x)
+            continue
+        if "." not in token and not token[-1].isalpha():
+            # Decimal comma
+            token = token.replace(",", ".")
+        tokens.append(token)
+    return tokens
+
+
+# Days in each month of a non leap year
+_month_days = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Get number of days in month. Equivalent to monthrange(year, month)[1]
+    without working out the weekday of the first day of the month.
+
+    Args:
+        year (int): Year
+        month (int): Month (1-12)
+
+    Returns:
+        int: Number of days in month
+    """
+    if month == 2 and isleap(year):
+        return 29
+    return _month_days[month - 1]
 
 
 # Ugly copy and paste from dateutil.parser._parser._ymd with dayfirst modified to mean day is outer value
 # ie. dayfirst prefers dmy or ymd where in dateutil it prefers dmy and ydm!
 class _ymd(list):  # pragma: no cover
+    # dateutil's _parse_numeric_token relies on the list protocol (len, append
+    # and truthiness) so keep subclassing list but without an instance dict
+    __slots__ = ("century_specified", "dstridx", "mstridx", "ystridx")
+
     def __init__(self, *args, **kwargs):
-        super(self.__class__, self).__init__(*args, **kwargs)
+        list.__init__(self, *args, **kwargs)
         self.century_specified = False
         self.dstridx = None
         self.mstridx = None
@@ -142,11 +543,11 @@ class _ymd(list):  # pragma: no cover
         elif not self.has_year:
             # Be permissive, assume leap year
             month = self[self.mstridx]
-            return 1 <= value <= monthrange(2000, month)[1]
+            return 1 <= value <= _days_in_month(2000, month)
         else:
             month = self[self.mstridx]
             year = self[self.ystridx]
-            return 1 <= value <= monthrange(year, month)[1]
+            return 1 <= value <= _days_in_month(year, month)
 
     def append(self, val, label=None):
         if hasattr(val, "__len__"):
@@ -161,7 +562,7 @@ class _ymd(list):  # pragma: no cover
                 raise ValueError(label)
             label = "Y"
 
-        super(self.__class__, self).append(int(val))
+        list.append(self, int(val))
 
         if label == "M":
             if self.has_month:
@@ -196,6 +597,18 @@ class _ymd(list):  # pragma: no cover
 
     def resolve_ymd(self, yearfirst, dayfirst):
         len_ymd = len(self)
+        ystridx = self.ystridx
+        mstridx = self.mstridx
+        dstridx = self.dstridx
+        if (
+            len_ymd == 3
+            and ystridx is not None
+            and mstridx is not None
+            and dstridx is not None
+        ):
+            # All identities known so no need to build strids
+            return self[ystridx], self[mstridx], self[dstridx]
+
         year, month, day = (None, None, None)
 
         strids = (
@@ -210,8 +623,6 @@ class _ymd(list):  # pragma: no cover
         ):
             return self._resolve_from_stridxs(strids)
 
-        mstridx = self.mstridx
-
         if len_ymd > 3:
             raise ValueError("More than three YMD values")
         elif len_ymd == 1 or (mstridx is not None and len_ymd == 2):
@@ -295,6 +706,13 @@ class _ymd(list):  # pragma: no cover
 
 # Ugly copy and paste from dateutil.dateparser with minor changes
 class DateParser(dateutil.parser.parser):  # pragma: no cover
+    def __init__(self, info=None):
+        super().__init__(info)
+        # These only depend on their arguments and the same timezone names and
+        # years recur when parsing many dates
+        self._tzoffset = lru_cache(maxsize=64)(self.info.tzoffset)
+        self._convertyear = lru_cache(maxsize=64)(self.info.convertyear)
+
     def _parse(
         self,
         timestr,
@@ -353,36 +771,59 @@ class DateParser(dateutil.parser.parser):  # pragma: no cover
             yearfirst = info.yearfirst
 
         res = self._result()
-        l = _timelex.split(timestr)  # noqa: E741
+        l = _split_tokens(timestr)  # noqa: E741
 
         skipped_idxs = []
 
         # year/month/day list
         ymd = _ymd()
 
+        # Bind methods used in the loop to locals to avoid repeated lookups
+        info_weekday = info.weekday
+        info_month = info.month
+        pertain = info.pertain
+        convertyear = self._convertyear
+        ampm = info.ampm
+        jump = info.jump
+        tzoffset = self._tzoffset
+        utczone = info.utczone
+        ampm_valid = self._ampm_valid
+        adjust_ampm = self._adjust_ampm
+        could_be_tzname = self._could_be_tzname
+        parse_numeric_token = self._parse_numeric_token
+
         len_l = len(l)
         i = 0
         try:
             while i < len_l:
                 # Check if it's a number
                 value_repr = l[i]
-                try:
-                    value = float(value_repr)
-                except ValueError:
+                if (
+                    value_repr.isascii()
+                    and not value_repr[0].isdigit()
+                    and value_repr.lower() not in _float_words
+                ):
+                    # Avoid raising and catching an exception for the many
+                    # tokens that cannot be numbers
                     value = None
+                else:
+                    try:
+                        value = float(value_repr)
+                    except ValueError:
+                        value = None
 
                 if value is not None:
                     # Numeric token
-                    i = self._parse_numeric_token(l, i, info, ymd, res, fuzzy)
+                    i = parse_numeric_token(l, i, info, ymd, res, fuzzy)
 
                 # Check weekday
-                elif info.weekday(l[i]) is not None:
-                    value = info.weekday(l[i])
+                elif info_weekday(value_repr) is not None:
+                    value = info_weekday(value_repr)
                     res.weekday = value
 
                 # Check month name
-                elif info.month(l[i]) is not None:
-                    value = info.month(l[i])
+                elif info_month(value_repr) is not None:
+                    value = info_month(value_repr)
                     ymd.append(value, "M")
 
                     if i + 1 < len_l:
@@ -401,14 +842,14 @@ class DateParser(dateutil.parser.parser):  # pragma: no cover
                         elif (
                             i + 4 < len_l
                             and l[i + 1] == l[i + 3] == " "
-                            and info.pertain(l[i + 2])
+                            and pertain(l[i + 2])
                         ):
                             # Jan of 01
                             # In this case, 01 is clearly year
                             if l[i + 4].isdigit():
                                 # Convert it here to become unambiguous
                                 value = int(l[i + 4])
-                                year = str(info.convertyear(value))
+                                year = str(convertyear(value))
                                 ymd.append(year, "Y")
                             else:
                                 # Wrong guess
@@ -417,23 +858,23 @@ class DateParser(dateutil.parser.parser):  # pragma: no cover
                             i += 4
 
                 # Check am/pm
-                elif info.ampm(l[i]) is not None:
-                    value = info.ampm(l[i])
-                    val_is_ampm = self._ampm_valid(res.hour, res.ampm, fuzzy)
+                elif ampm(value_repr) is not None:
+                    value = ampm(value_repr)
+                    val_is_ampm = ampm_valid(res.hour, res.ampm, fuzzy)
 
                     if val_is_ampm:
-                        res.hour = self._adjust_ampm(res.hour, value)
+                        res.hour = adjust_ampm(res.hour, value)
                         res.ampm = value
 
                     elif fuzzy:
                         skipped_idxs.append(i)
 
                 # Check for a timezone name
-                elif self._could_be_tzname(
-                    res.hour, res.tzname, res.tzoffset, l[i]
+                elif could_be_tzname(
+                    res.hour, res.tzname, res.tzoffset, value_repr
                 ):
-                    res.tzname = l[i]
-                    res.tzoffset = info.tzoffset(res.tzname)
+                    res.tzname = value_repr
+                    res.tzoffset = tzoffset(res.tzname)
 
                     # Check for something like GMT+3, or BRST+3. Notice
                     # that it doesn't mean "I am 3 hours after GMT", but
@@ -443,14 +884,14 @@ class DateParser(dateutil.parser.parser):  # pragma: no cover
                     if i + 1 < len_l and l[i + 1] in ("+", "-"):
                         l[i + 1] = ("+", "-")[l[i + 1] == "+"]
                         res.tzoffset = None
-                        if info.utczone(res.tzname):
+                        if utczone(res.tzname):
                             # With something like GMT+3, the timezone
                             # is *not* GMT.
                             res.tzname = None
 
                 # Check for a numbered timezone
-                elif res.hour is not None and l[i] in ("+", "-"):
-                    signal = (-1, 1)[l[i] == "+"]
+                elif res.hour is not None and value_repr in ("+", "-"):
+                    signal = (-1, 1)[value_repr == "+"]
                     len_li = len(l[i + 1])
 
                     # TODO: check that l[i + 1] is integer?
@@ -479,11 +920,11 @@ class DateParser(dateutil.parser.parser):  # pragma: no cover
                     # Look for a timezone name between parenthesis
                     if (
                         i + 5 < len_l
-                        and info.jump(l[i + 2])
+                        and jump(l[i + 2])
                         and l[i + 3] == "("
                         and l[i + 5] == ")"
                         and 3 <= len(l[i + 4])
-                        and self._could_be_tzname(
+                        and could_be_tzname(
                             res.hour, res.tzname, None, l[i + 4]
                         )
                     ):
@@ -494,7 +935,7 @@ class DateParser(dateutil.parser.parser):  # pragma: no cover
                     i += 1
 
                 # Check jumps
-                elif not (info.jump(l[i]) or fuzzy):
+                elif not (jump(value_repr) or fuzzy):
                     raise ValueError(timestr)
 
                 else:
@@ -530,27 +971,106 @@ class DateParser(dateutil.parser.parser):  # pragma: no cover
         >>> _recombine_skipped_date(tokens, skipped_idxs)
         ["foo bar", "baz"], ["19June2000"]
         """
+        skipped = set(skipped_idxs)
         skipped_tokens = []
         date_tokens = []
-        prev = None
-        for idx, token in enumerate(tokens):
-            if idx in skipped_idxs:
-                if prev is None or prev == "date":
-                    skipped_tokens.append(token)
-                else:
-                    skipped_tokens[-1] = skipped_tokens[-1] + token
-                prev = "skipped"
+        len_tokens = len(tokens)
+        start = 0
+        # Join each run of consecutive skipped or date tokens in one go
+        while start < len_tokens:
+            is_skipped = start in skipped
+            end = start + 1
+            while end < len_tokens and (end in skipped) == is_skipped:
+                end += 1
+            run = "".join(tokens[start:end])
+            if is_skipped:
+                skipped_tokens.append(run)
             else:
-                if prev is None or prev == "skipped":
-                    date_tokens.append(token)
-                else:
-                    date_tokens[-1] = date_tokens[-1] + token
-                prev = "date"
+                date_tokens.append(run)
+            start = end
 
         return skipped_tokens, date_tokens
 
 
 DEFAULTPARSER = DateParser(parserinfo(dayfirst=True))
+_build_naive = DEFAULTPARSER._build_naive
+_build_tzaware = DEFAULTPARSER._build_tzaware
+
+
+def _parse_result(timestr: str, **kwargs: Any) -> Tuple[Any, Any, Any]:
+    """Run the date parser over a string without building a datetime from the
+    result so that the result can be combined with more than one default.
+
+    Args:
+        timestr (str): Date string
+        **kwargs: Keyword arguments as passed to DateParser._parse
+
+    Returns:
+        Tuple[Any, Any, Any]: Parse result, skipped tokens and date tokens
+    """
+    res, skipped_tokens, date_tokens = DEFAULTPARSER._parse(timestr, **kwargs)
+
+    if res is None:
+        raise ParserError("Unknown string format: %s", timestr)
+
+    if len(res) == 0:
+        raise ParserError("String does not contain a date: %s", timestr)
+
+    return res, skipped_tokens, date_tokens
+
+
+def _build_datetime(
+    res: Any,
+    default: datetime,
+    timestr: str,
+    ignoretz: bool,
+    tzinfos: Optional[Mapping],
+) -> datetime:
+    """Build datetime from a parse result filling in any elements missing from
+    the result using the default.
+
+    Args:
+        res (Any): Parse result from _parse_result
+        default (datetime): Datetime supplying elements missing from result
+        timestr (str): Date string (for error messages)
+        ignoretz (bool): Whether to ignore timezone information
+        tzinfos (Optional[Mapping]): Additional time zone names to offsets
+
+    Returns:
+        datetime: Parsed datetime
+    """
+    try:
+        ret = _build_naive(res, default)
+    except ValueError as e:
+        raise ParserError(str(e) + f": {timestr}") from e
+
+    if not ignoretz:
+        ret = _build_tzaware(ret, res, tzinfos)
+    return ret
+
+
+# Local midnight today and the timestamps between which it is valid
+_today_cache = (0.0, 0.0, None)
+
+
+def _today() -> datetime:
+    """Get local midnight today, only converting the current time to a local
+    datetime when the day changes.
+
+    Returns:
+        datetime: Local midnight today
+    """
+    global _today_cache
+    now = time.time()
+    start, end, today = _today_cache
+    if not start <= now < end:
+        today = datetime.fromtimestamp(now).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        start = today.timestamp()
+        end = (today + timedelta(days=1)).timestamp()
+        _today_cache = (start, end, today)
+    return today
 
 
 def parse(
@@ -618,28 +1138,15 @@ def parse(
         your system.
     """
 
+    fuzzy_with_tokens = kwargs.pop("fuzzy_with_tokens", False)
+    res, skipped_tokens, date_tokens = _parse_result(
+        timestr, fuzzy_with_tokens=fuzzy_with_tokens, **kwargs
+    )
     if default is None:
-        default = datetime.now().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
+        default = _today()
+    ret = _build_datetime(res, default, timestr, ignoretz, tzinfos)
 
-    res, skipped_tokens, date_tokens = DEFAULTPARSER._parse(timestr, **kwargs)
-
-    if res is None:
-        raise ParserError("Unknown string format: %s", timestr)
-
-    if len(res) == 0:
-        raise ParserError("String does not contain a date: %s", timestr)
-
-    try:
-        ret = DEFAULTPARSER._build_naive(res, default)
-    except ValueError as e:
-        raise ParserError(str(e) + f": {timestr}") from e
-
-    if not ignoretz:
-        ret = DEFAULTPARSER._build_tzaware(ret, res, tzinfos)
-
-    if kwargs.get("fuzzy_with_tokens", False):
+    if fuzzy_with_tokens:
         return ret, skipped_tokens, date_tokens
     else:
         return ret
@@ -699,6 +1206,9 @@ def parse_date_range(
     If max_starttime is True, then the start date's time is set to 23:59:59. If
     max_endtime is True, then the end date's time is set to 23:59:59.
 
+    Results of non fuzzy parsing are cached so that repeated date strings (as
+    are common in tabular data) are only parsed once.
+
     When inferring time zones, a default set of time zones will be used unless
     overridden by passing in default_timezones which is a string of the form:
 
@@ -719,86 +1229,217 @@ def parse_date_range(
     Returns:
         Tuple[datetime,datetime]: Tuple containing start date and end date
     """
-    if date_format is None or fuzzy is not None:
+    # Only cache hashable strings, not eg. bytearray
+    if fuzzy is None and isinstance(string, (str, bytes)):
+        return _parse_date_range_cached(
+            string,
+            date_format,
+            timezone_handling,
+            include_microseconds,
+            zero_time,
+            max_starttime,
+            max_endtime,
+            default_timezones,
+        )
+    return _parse_date_range(
+        string,
+        date_format,
+        timezone_handling,
+        fuzzy,
+        include_microseconds,
+        zero_time,
+        max_starttime,
+        max_endtime,
+        default_timezones,
+    )
+
+
+def parse_date_range_batch(
+    strings: Iterable[str],
+    date_format: Optional[str] = None,
+    timezone_handling: int = 0,
+    include_microseconds: bool = False,
+    zero_time: bool = False,
+    max_starttime: bool = False,
+    max_endtime: bool = False,
+    default_timezones: Optional[str] = None,
+) -> List[Tuple[datetime, datetime]]:
+    """Parse date ranges from strings using specified date_format if given.
+    Each distinct string is only parsed once. See parse_date_range for details
+    of the parameters other than strings. Fuzzy matching is not supported.
+
+    Args:
+        strings (Iterable[str]): Dataset date strings
+        date_format (Optional[str]): Date format. If None is given, will attempt to guess. Defaults to None.
+        timezone_handling (int): Timezone handling. See description. Defaults to 0 (ignore timezone, return UTC).
+        include_microseconds (bool): Includes microseconds if True. Defaults to False.
+        zero_time (bool): Zero time elements of datetime if True. Defaults to False.
+        max_starttime (bool): Make start date time component 23:59:59:999999. Defaults to False.
+        max_endtime (bool): Make end date time component 23:59:59:999999. Defaults to False.
+        default_timezones (Optional[str]): Timezone information. Defaults to None. (Internal default).
+
+    Returns:
+        List[Tuple[datetime,datetime]]: List of tuples of start date and end date
+    """
+    date_ranges = {}
+    results = []
+    for string in strings:
+        date_range = date_ranges.get(string)
+        if date_range is None:
+            date_range = _parse_date_range(
+                string,
+                date_format,
+                timezone_handling,
+                None,
+                include_microseconds,
+                zero_time,
+                max_starttime,
+                max_endtime,
+                default_timezones,
+            )
+            date_ranges[string] = date_range
+        results.append(date_range)
+    return results
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_range_cached(
+    string: str,
+    date_format: Optional[str],
+    timezone_handling: int,
+    include_microseconds: bool,
+    zero_time: bool,
+    max_starttime: bool,
+    max_endtime: bool,
+    default_timezones: Optional[str],
+) -> Tuple[datetime, datetime]:
+    """Memoized version of _parse_date_range for non fuzzy parsing. Returned
+    datetimes are immutable so they can safely be shared between callers.
+    Parsing failures are not cached.
+
+    Args:
+        string (str): Dataset date string
+        date_format (Optional[str]): Date format
+        timezone_handling (int): Timezone handling
+        include_microseconds (bool): Includes microseconds if True
+        zero_time (bool): Zero time elements of datetime if True
+        max_starttime (bool): Make start date time component 23:59:59:999999
+        max_endtime (bool): Make end date time component 23:59:59:999999
+        default_timezones (Optional[str]): Timezone information
+
+    Returns:
+        Tuple[datetime,datetime]: Tuple containing start date and end date
+    """
+    return _parse_date_range(
+        string,
+        date_format,
+        timezone_handling,
+        None,
+        include_microseconds,
+        zero_time,
+        max_starttime,
+        max_endtime,
+        default_timezones,
+    )
+
+
+def _parse_date_range(
+    string: str,
+    date_format: Optional[str],
+    timezone_handling: int,
+    fuzzy: Optional[Dict],
+    include_microseconds: bool,
+    zero_time: bool,
+    max_starttime: bool,
+    max_endtime: bool,
+    default_timezones: Optional[str],
+) -> Tuple[datetime, datetime]:
+    """Parse date from string returning start date and end date. See
+    parse_date_range for a description of the parameters.
+
+    Args:
+        string (str): Dataset date string
+        date_format (Optional[str]): Date format
+        timezone_handling (int): Timezone handling
+        fuzzy (Optional[Dict]): If dict supplied, fuzzy matching will be used and results returned in dict
+        include_microseconds (bool): Includes microseconds if True
+        zero_time (bool): Zero time elements of datetime if True
+        max_starttime (bool): Make start date time component 23:59:59:999999
+        max_endtime (bool): Make end date time component 23:59:59:999999
+        default_timezones (Optional[str]): Timezone information
+
+    Returns:
+        Tuple[datetime,datetime]: Tuple containing start date and end date
+    """
+    # The fast paths use str patterns so leave other input eg. bytes to
+    # dateutil
+    if date_format is None and fuzzy is None and isinstance(string, str):
+        if _has_digit.search(string) is None:
+            # A year needs digits so there is no point running dateutil
+            raise ParserError("No year in date!")
+        date_range = _parse_date_range_fast(string, timezone_handling < 2)
+    else:
+        date_range = None
+    has_time = True
+    if date_range is not None:
+        startdate, enddate = date_range
+    elif date_format is None or fuzzy is not None:
         if timezone_handling >= 2:
             if default_timezones is None:
                 tzinfos = default_tzinfos
             else:
-                tzinfos = get_tzinfos(default_timezones)
+                tzinfos = _get_tzinfos_cached(default_timezones)
             ignoretz = False
         else:
             ignoretz = True
             tzinfos = None
 
+        # Parse once and fill in missing elements from both defaults
+        if fuzzy is not None:
+            res, nondate, date = _parse_result(string, fuzzy_with_tokens=True)
+        else:
+            res, _, _ = _parse_result(string)
+        startdate = _build_datetime(
+            res, default_date_notz, string, ignoretz, tzinfos
+        )
+        enddate = _build_datetime(
+            res, default_enddate_notz, string, ignoretz, tzinfos
+        )
         if fuzzy is not None:
-            parsed_string1 = parse(
-                string,
-                fuzzy_with_tokens=True,
-                default=default_date_notz,
-                ignoretz=ignoretz,
-                tzinfos=tzinfos,
-            )
-            parsed_string2 = parse(
-                string,
-                fuzzy_with_tokens=True,
-                default=default_enddate_notz,
-                ignoretz=ignoretz,
-                tzinfos=tzinfos,
-            )
-            startdate = parsed_string1[0]
-            enddate = parsed_string2[0]
-            nondate = parsed_string1[1]
             if nondate:
                 fuzzy["nondate"] = nondate
             else:
                 fuzzy["nondate"] = None
-            fuzzy["date"] = parsed_string1[2]
-        else:
-            startdate = parse(
-                string,
-                default=default_date_notz,
-                ignoretz=ignoretz,
-                tzinfos=tzinfos,
-            )
-            enddate = parse(
-                string,
-                default=default_enddate_notz,
-                ignoretz=ignoretz,
-                tzinfos=tzinfos,
-            )
-        if (
-            startdate.year == default_sd_year
-            and enddate.year == default_ed_year
-        ):
+            fuzzy["date"] = date
+        if res.year is None:
             raise ParserError("No year in date!")
     else:
         try:
-            startdate = datetime.strptime(string, date_format)
+            startdate = _strptime(string, date_format)
         except ValueError as e:
             raise ParserError(str(e)) from e
+        has_year, has_day, has_month, has_time = _format_flags(date_format)
         if (
-            startdate.year == 1900 and "%Y" not in date_format
+            startdate.year == 1900 and not has_year
         ):  # 1900 is default when no year supplied
             raise ParserError("No year in date!")
         enddate = startdate
-        if not any(x in date_format for x in ["%d", "%j"]):
-            startdate = startdate.replace(day=default_date.day)
-            endday = default_enddate.day
-            not_set = True
-            while not_set:
-                try:
-                    enddate = enddate.replace(day=endday)
-                    not_set = False
-                except ValueError as e:
-                    endday -= 1
-                    if endday == 0:
-                        raise ParserError(
-                            f"No end day of month found for {str(enddate)}!"
-                        ) from e
-        if not any(str in date_format for str in ["%b", "%B", "%m", "%j"]):
-            startdate = startdate.replace(month=default_date.month)
-            enddate = enddate.replace(month=default_enddate.month)
-    if zero_time:
+        if not has_day or not has_month:
+            # Fill in missing day and month with one replace per date
+            if has_month:
+                startmonth = endmonth = startdate.month
+            else:
+                startmonth = default_date.month
+                endmonth = default_enddate.month
+            if has_day:
+                startday = endday = startdate.day
+            else:
+                startday = default_date.day
+                endday = _days_in_month(startdate.year, startdate.month)
+            startdate = startdate.replace(month=startmonth, day=startday)
+            enddate = enddate.replace(month=endmonth, day=endday)
+    # Dates parsed with a format that has no time elements are at midnight
+    if zero_time and has_time:
         if not max_starttime:
             startdate = startdate.replace(
                 hour=0, minute=0, second=0, microsecond=0
@@ -899,12 +1540,9 @@ def parse_date(
         datetime: The parsed date
     """
     if max_time:
-        max_starttime = True
-        max_endtime = True
-        zero_time = False
+        max_starttime, max_endtime, zero_time = True, True, False
     else:
-        max_starttime = False
-        max_endtime = False
+        max_starttime, max_endtime = False, False
 
     startdate, enddate = parse_date_range(
         string,
@@ -922,6 +1560,62 @@ def parse_date(
     return startdate
 
 
+def parse_dates(
+    strings: Iterable[str],
+    date_format: Optional[str] = None,
+    timezone_handling: int = 0,
+    include_microseconds: bool = False,
+    zero_time: bool = False,
+    max_time: bool = False,
+    default_timezones: Optional[str] = None,
+) -> List[datetime]:
+    """Parse dates from strings using specified date_format if given. Each
+    distinct string is only parsed once. See parse_date for details of the
+    parameters other than strings. Fuzzy matching is not supported.
+
+    Args:
+        strings (Iterable[str]): Dataset date strings
+        date_format (Optional[str]): Date format. If None is given, will attempt to guess. Defaults to None.
+        timezone_handling (int): Timezone handling. See description. Defaults to 0 (ignore timezone, return UTC).
+        include_microseconds (bool): Includes microseconds if True. Defaults to False.
+        zero_time (bool): Zero time elements of datetime if True. Defaults to False.
+        max_time (bool): Make date time component 23:59:59:999999. Defaults to False.
+        default_timezones (Optional[str]): Timezone information. Defaults to None. (Internal default).
+
+    Returns:
+        List[datetime]: The parsed dates
+    """
+    if max_time:
+        max_starttime, max_endtime, zero_time = True, True, False
+    else:
+        max_starttime, max_endtime = False, False
+
+    dates = []
+    for startdate, enddate in parse_date_range_batch(
+        strings,
+        date_format=date_format,
+        timezone_handling=timezone_handling,
+        include_microseconds=include_microseconds,
+        zero_time=zero_time,
+        max_starttime=max_starttime,
+        max_endtime=max_endtime,
+        default_timezones=default_timezones,
+    ):
+        if startdate != enddate:
+            raise ParserError("date is not a specific day!")
+        dates.append(startdate)
+    return dates
+
+
+# Expose clearing of the shared cache of non fuzzy parse results as lru_cache
+# does for the functions it wraps
+parse_date_range.cache_clear = _parse_date_range_cached.cache_clear
+parse_date.cache_clear = _parse_date_range_cached.cache_clear
+
+
+_epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
 def get_timestamp_from_datetime(date: datetime) -> float:
     """Convert datetime to timestamp.
 
@@ -932,44 +1626,52 @@ def get_timestamp_from_datetime(date: datetime) -> float:
         float: Timestamp
     """
     if date.tzinfo is None:
-        return (
-            time.mktime(
-                (
-                    date.year,
-                    date.month,
-                    date.day,
-                    date.hour,
-                    date.minute,
-                    date.second,
-                    -1,
-                    -1,
-                    -1,
+        # Naive datetimes are treated as local time as with time.mktime
+        try:
+            return date.timestamp()
+        except (OverflowError, ValueError):
+            # datetime.timestamp cannot handle dates near year 1 eg.
+            # default_date_notz but time.mktime can
+            return (
+                time.mktime(
+                    (
+                        date.year,
+                        date.month,
+                        date.day,
+                        date.hour,
+                        date.minute,
+                        date.second,
+                        -1,
+                        -1,
+                        -1,
+                    )
                 )
+                + date.microsecond / 1e6
             )
-            + date.microsecond / 1e6
-        )
     else:
-        return (
-            date - datetime(1970, 1, 1, tzinfo=timezone.utc)
-        ).total_seconds()
+        return (date - _epoch).total_seconds()
 
 
 def get_datetime_from_timestamp(
     timestamp: float,
     timezone: datetime.tzinfo = timezone.utc,
-    today: datetime = now_utc(),
+    today: Optional[datetime] = None,
 ) -> datetime:
     """Convert timestamp to datetime.
 
     Args:
         timestamp (float): Timestamp to convert
         timezone (datetime.tzinfo): Timezone to use
-        today (datetime): Today's date. Defaults to now_utc.
+        today (Optional[datetime]): Today's date. Defaults to None (now_utc()).
 
     Returns:
         datetime: Date of timestamp
     """
-    if timestamp > get_timestamp_from_datetime(today):
+    if today is None:
+        now = time.time()
+    else:
+        now = get_timestamp_from_datetime(today)
+    if timestamp > now:
         timestamp = timestamp / 1000
     return datetime.fromtimestamp(timestamp, tz=timezone)
 
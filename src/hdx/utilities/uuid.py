@@ -18,10 +18,14 @@ def is_valid_uuid(uuid_to_test: str, version: int = 4) -> bool:
         version (int): UUID version. Defaults to 4.
 
     Returns:
-        str: Current script's directory
+        bool: True if uuid_to_test is a valid UUID, False if not
     """
+    # The canonical form is always 36 characters so anything else can be
+    # rejected without constructing a UUID
+    if not isinstance(uuid_to_test, str) or len(uuid_to_test) != 36:
+        return False
     try:
         uuid_obj = UUID(uuid_to_test, version=version)
-    except Exception:
+    except ValueError:
         return False
     return str(uuid_obj) == uuid_to_test
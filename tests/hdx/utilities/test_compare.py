@@ -1,10 +1,13 @@
 """Compare Utility Tests"""
 
+from os import stat, utime
 from os.path import join
+from shutil import copyfile
 
 import pytest
 
 from hdx.utilities.compare import assert_files_same, compare_files
+from hdx.utilities.path import temp_dir
 
 
 class TestCompare:
@@ -24,4 +27,30 @@ class TestCompare:
             "+ coal   ,1      ,7.4    ,'notneeded'",
             "?         ^                +++\n",
         ]
+        assert compare_files(testfile1, testfile1) == []
         assert_files_same(testfile1, testfile1)
+        with pytest.raises(AssertionError):
+            assert_files_same(testfile1, testfile2)
+
+    def test_compare_files_identical(self, testfile1):
+        with temp_dir(folder="test_compare") as tmpdir:
+            copied_file = join(tmpdir, "test_csv_processing.csv")
+            copyfile(testfile1, copied_file)
+            assert compare_files(testfile1, copied_file) == []
+            assert_files_same(testfile1, copied_file)
+
+    def test_compare_files_rewritten(self):
+        with temp_dir(folder="test_compare_rewritten") as tmpdir:
+            path1 = join(tmpdir, "a.csv")
+            path2 = join(tmpdir, "b.csv")
+            for path in (path1, path2):
+                with open(path, "w") as f:
+                    f.write("x,1\n")
+            assert compare_files(path1, path2) == []
+            stats = stat(path2)
+            with open(path2, "w") as f:
+                f.write("y,2\n")
+            utime(path2, ns=(stats.st_atime_ns, stats.st_mtime_ns))
+            assert compare_files(path1, path2) == ["- x,1", "+ y,2"]
+            with pytest.raises(AssertionError):
+                assert_files_same(path1, path2)
@@ -1,18 +1,27 @@
 """Date Parse Utility Tests"""
 
+import time
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from dateutil.parser import ParserError
 
 from hdx.utilities.dateparse import (
+    _split_tokens,
+    _today,
+    default_date_notz,
+    default_tzinfos,
     get_datetime_from_timestamp,
     get_timestamp_from_datetime,
+    get_tzinfos,
     iso_string_from_datetime,
     now_utc,
     now_utc_notz,
+    parse,
     parse_date,
     parse_date_range,
+    parse_date_range_batch,
+    parse_dates,
 )
 
 
@@ -25,6 +34,20 @@ class TestDateParse:
             timezone.utc
         ).replace(second=0, microsecond=0, tzinfo=None)
 
+    def test_parse(self):
+        default = datetime(2013, 2, 10)
+        assert parse("10:30", default=default) == datetime(2013, 2, 10, 10, 30)
+        # Without a default, today is used. Check against today before and
+        # after parsing in case the test straddles local midnight.
+        before = _today()
+        results = parse("10:30"), parse("10:30")
+        expected = {
+            before.replace(hour=10, minute=30),
+            _today().replace(hour=10, minute=30),
+        }
+        assert set(results) <= expected
+        assert parse("10/02/2013 10:30") == datetime(2013, 2, 10, 10, 30)
+
     def test_parse_date_range(self):
         result = (
             datetime(2013, 2, 10, 0, 0, tzinfo=timezone.utc),
@@ -32,6 +55,43 @@ class TestDateParse:
         )
         assert parse_date_range("10/02/2013") == result
         assert parse_date_range("2013/02/10") == result
+        assert parse_date_range("2013-02-10") == result
+        assert parse_date_range(b"2013-02-10") == result
+        assert parse_date_range(bytearray(b"2013-02-10")) == result
+        result = (
+            datetime(2013, 2, 10, 10, 0, 0, 500000, tzinfo=timezone.utc),
+            datetime(2013, 2, 10, 10, 0, 0, 500000, tzinfo=timezone.utc),
+        )
+        assert (
+            parse_date_range(
+                "2013-02-10T10:00:00.5", include_microseconds=True
+            )
+            == result
+        )
+        result = (
+            datetime(2013, 2, 13, 0, 0, tzinfo=timezone.utc),
+            datetime(2013, 2, 13, 0, 0, tzinfo=timezone.utc),
+        )
+        assert parse_date_range("2013-13-02") == result
+        assert parse_date_range("13/02/2013") == result
+        assert parse_date_range("02/13/2013") == result
+        assert parse_date_range("20130213") == result
+        result = (
+            datetime(2013, 2, 10, 10, 0, tzinfo=timezone.utc),
+            datetime(2013, 2, 10, 10, 0, tzinfo=timezone.utc),
+        )
+        assert parse_date_range("2013-02-10T10:00:00Z") == result
+        assert parse_date_range("10.02.2013 10:00") == result
+        assert parse_date_range("2013/02/10 10:00:00") == result
+        assert parse_date_range("2013-02-10T10:00:00+05:30") == result
+        result = (
+            datetime(2013, 2, 10, 4, 30, tzinfo=timezone.utc),
+            datetime(2013, 2, 10, 4, 30, tzinfo=timezone.utc),
+        )
+        assert (
+            parse_date_range("2013-02-10T10:00:00+05:30", timezone_handling=4)
+            == result
+        )
         result = (
             datetime(2013, 2, 20, 10, 0, tzinfo=timezone.utc),
             datetime(2013, 2, 20, 10, 0, tzinfo=timezone.utc),
@@ -116,6 +176,13 @@ class TestDateParse:
         )
         assert parse_date_range("02/2013") == result
         assert parse_date_range("02/2013", "%m/%Y") == result
+        assert parse_date_range("02/2016", "%m/%Y") == (
+            datetime(2016, 2, 1, 0, 0, tzinfo=timezone.utc),
+            datetime(2016, 2, 29, 0, 0, tzinfo=timezone.utc),
+        )
+        assert parse_date_range("04/2013", "%m/%Y")[1] == datetime(
+            2013, 4, 30, 0, 0, tzinfo=timezone.utc
+        )
         fuzzy = {}
         assert (
             parse_date_range("date is 02/2013 for this test", fuzzy=fuzzy)
@@ -133,6 +200,14 @@ class TestDateParse:
         )
         assert parse_date_range("2013") == result
         assert parse_date_range("2013", "%Y") == result
+        assert parse_date_range("2016-02") == (
+            datetime(2016, 2, 1, 0, 0, tzinfo=timezone.utc),
+            datetime(2016, 2, 29, 0, 0, tzinfo=timezone.utc),
+        )
+        assert parse_date_range("2013/02") == (
+            datetime(2013, 2, 1, 0, 0, tzinfo=timezone.utc),
+            datetime(2013, 2, 28, 0, 0, tzinfo=timezone.utc),
+        )
         fuzzy = {}
         date = datetime(2001, 12, 10, 0, 0, tzinfo=timezone.utc)
         result = date, date
@@ -161,6 +236,95 @@ class TestDateParse:
             parse_date_range("02/20")
         with pytest.raises(ParserError):
             parse_date_range("20/02", "%d/%m")
+        with pytest.raises(ParserError, match="No year in date!"):
+            parse_date_range("Sat")
+        for string in ("", "  ", "lalala"):
+            with pytest.raises(ParserError, match="No year in date!"):
+                parse_date_range(string)
+
+    def test_get_tzinfos(self):
+        assert get_tzinfos("-11 X NUT\n5.75 NPT\n-9.5 MART\n-.5 Q") == {
+            "X": -39600,
+            "NUT": -39600,
+            "NPT": 20700,
+            "MART": -34200,
+            "Q": -1800,
+        }
+        assert get_tzinfos("55e-1 X") == {"X": 19800}
+        for offset in ("-", "+", "--", "+-", "."):
+            with pytest.raises(ValueError):
+                get_tzinfos(f"{offset} X")
+        assert default_tzinfos["IST"] == 19800
+        with pytest.raises(TypeError):
+            default_tzinfos["IST"] = 0
+
+    def test_split_tokens(self):
+        assert _split_tokens("Sep.20.2009 4:30:21.447") == [
+            "Sep",
+            ".",
+            "20",
+            ".",
+            "2009",
+            " ",
+            "4",
+            ":",
+            "30",
+            ":",
+            "21.447",
+        ]
+        assert _split_tokens("10,5 1.a") == ["10.5", " ", "1.a"]
+        assert _split_tokens("3rd\tof\x00 May") == [
+            "3",
+            "rd",
+            " ",
+            "of",
+            " ",
+            "May",
+        ]
+        assert _split_tokens("1er février") == ["1", "er", " ", "février"]
+
+    def test_parse_date_range_cached(self):
+        result = parse_date_range("10/02/2013")
+        assert parse_date_range("10/02/2013") is result
+        assert parse_date_range("10/02/2013", timezone_handling=1) == (
+            datetime(2013, 2, 10, 0, 0),
+            datetime(2013, 2, 10, 0, 0),
+        )
+        fuzzy = {}
+        assert parse_date_range("10/02/2013", fuzzy=fuzzy) == result
+        assert fuzzy["date"] == ("10/02/2013",)
+        parse_date_range.cache_clear()
+        assert parse_date_range("10/02/2013") is not result
+        result = parse_date("10/02/2013")
+        assert parse_date("10/02/2013") is result
+        parse_date.cache_clear()
+        assert parse_date("10/02/2013") is not result
+
+    def test_parse_date_range_batch(self):
+        result = parse_date_range_batch(["2013", "02/2013", "2013"])
+        assert result == [
+            (
+                datetime(2013, 1, 1, 0, 0, tzinfo=timezone.utc),
+                datetime(2013, 12, 31, 0, 0, tzinfo=timezone.utc),
+            ),
+            (
+                datetime(2013, 2, 1, 0, 0, tzinfo=timezone.utc),
+                datetime(2013, 2, 28, 0, 0, tzinfo=timezone.utc),
+            ),
+            (
+                datetime(2013, 1, 1, 0, 0, tzinfo=timezone.utc),
+                datetime(2013, 12, 31, 0, 0, tzinfo=timezone.utc),
+            ),
+        ]
+        assert result[0] is result[2]
+        result = parse_date_range_batch(
+            (x for x in ["20/02/2013"]), "%d/%m/%Y", timezone_handling=1
+        )
+        assert result == [
+            (datetime(2013, 2, 20, 0, 0), datetime(2013, 2, 20, 0, 0))
+        ]
+        with pytest.raises(ParserError):
+            parse_date_range_batch(["2013", "NOT A DATE"])
 
     def test_parse_date(self):
         assert parse_date("20/02/2013") == datetime(
@@ -304,11 +468,31 @@ class TestDateParse:
         with pytest.raises(ParserError):
             parse_date("02/2013", "%m/%Y")
 
+    def test_parse_dates(self):
+        result = parse_dates(["20/02/2013", "2013-02-21", "20/02/2013"])
+        assert result == [
+            datetime(2013, 2, 20, 0, 0, tzinfo=timezone.utc),
+            datetime(2013, 2, 21, 0, 0, tzinfo=timezone.utc),
+            datetime(2013, 2, 20, 0, 0, tzinfo=timezone.utc),
+        ]
+        assert parse_dates(["20/02/2013 10:00:00"], max_time=True) == [
+            datetime(2013, 2, 20, 23, 59, 59, tzinfo=timezone.utc)
+        ]
+        with pytest.raises(ParserError):
+            parse_dates(["20/02/2013", "02/2013"])
+
     def test_get_datetime_from_timestamp(self):
         expected_timestamp = 1596180834.0
         expected_date = datetime(2020, 7, 31, 7, 33, 54, tzinfo=timezone.utc)
         timestamp = get_timestamp_from_datetime(expected_date)
         assert timestamp == expected_timestamp
+        naive_date = datetime(2020, 7, 31, 7, 33, 54, 500000)
+        assert get_timestamp_from_datetime(naive_date) == (
+            time.mktime(naive_date.timetuple()) + 0.5
+        )
+        assert get_timestamp_from_datetime(default_date_notz) == time.mktime(
+            default_date_notz.timetuple()
+        )
         date = get_datetime_from_timestamp(
             expected_timestamp, timezone=timezone.utc
         )
@@ -317,6 +501,20 @@ class TestDateParse:
             expected_timestamp * 1000, timezone=timezone.utc
         )
         assert date == expected_date
+        date = get_datetime_from_timestamp(
+            expected_timestamp * 1000,
+            timezone=timezone.utc,
+            today=datetime(2020, 7, 31, 7, 33, 54, tzinfo=timezone.utc),
+        )
+        assert date == expected_date
+        date = get_datetime_from_timestamp(
+            expected_timestamp,
+            timezone=timezone.utc,
+            today=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        )
+        assert date == datetime(
+            1970, 1, 19, 11, 23, 0, 834000, tzinfo=timezone.utc
+        )
 
     def test_iso_string_from_datetime(self):
         date = datetime(2020, 7, 31, 7, 33, 54, tzinfo=timezone.utc)
@@ -11,3 +11,6 @@ class TestUUID:
         assert is_valid_uuid("") is False
         assert is_valid_uuid("jpsmith") is False
         assert is_valid_uuid("c9bf9e57-1685-4c89-bafb-ff5af830be8a") is True
+        assert is_valid_uuid("C9BF9E57-1685-4C89-BAFB-FF5AF830BE8A") is False
+        assert is_valid_uuid("c9bf9e57-1685-1c89-bafb-ff5af830be8a") is False
+        assert is_valid_uuid("c9bf9e57x1685-4c89-bafb-ff5af830be8a") is False